@@ -269,7 +269,7 @@ export const useGameState = (onPlayerDeath?: () => void) => {
                         }
                     },
                     // On other player splits
-                    (splits) => {
+                    (splits, playerIds) => {
                         // Initialize splits with interpolation data
                         const splitsWithInterpolation = splits.map(split => ({
                             ...split,
@@ -278,12 +278,27 @@ export const useGameState = (onPlayerDeath?: () => void) => {
                             lastUpdateTime: Date.now(),
                             updateInterval: 50
                         }));
-                        gameState.current.otherPlayerSplits = splitsWithInterpolation;
+                        if (playerIds) {
+                            // Partial update: replace only the listed players' splits
+                            const updated = new Set(playerIds);
+                            gameState.current.otherPlayerSplits = gameState.current.otherPlayerSplits
+                                .filter(s => !updated.has(s.playerId))
+                                .concat(splitsWithInterpolation);
+                        } else {
+                            gameState.current.otherPlayerSplits = splitsWithInterpolation;
+                        }
                         console.log(`Received ${splits.length} other player splits`);
                     },
                     // On other player ejected
-                    (ejected) => {
-                        gameState.current.otherPlayerEjected = ejected;
+                    (ejected, playerIds) => {
+                        if (playerIds) {
+                            const updated = new Set(playerIds);
+                            gameState.current.otherPlayerEjected = gameState.current.otherPlayerEjected
+                                .filter(e => !updated.has(e.playerId))
+                                .concat(ejected);
+                        } else {
+                            gameState.current.otherPlayerEjected = ejected;
+                        }
                     },
                     // On player consumed
                     (targetId, targetType, consumerId, newMass, gainedMass, consumingEntityType, consumingEntityId) => {
@@ -45,6 +45,11 @@ interface ServerVirus {
     lastFeedAngle?: number;
 }
 
+// Binary frame opcodes (JSON frames always start with '{')
+const OPCODE_PROJECTILE_UPDATE = 0x01;
+const PROJECTILE_HEADER_SIZE = 3;  // uint8 opcode + uint16 count
+const PROJECTILE_ENTRY_SIZE = 28;  // uint32 id + 6 float32
+
 interface ServerVirusProjectile {
     id: number;
     x: number;
@@ -57,6 +62,7 @@ interface ServerVirusProjectile {
 
 export class WebSocketService {
     private ws: WebSocket | null = null;
+    private decoder: TextDecoder = new TextDecoder();
     private reconnectInterval: number | null = null;
     private lastUpdateTime: number = 0;
     private updateInterval: number = 50; // Send updates every 50ms
@@ -75,8 +81,8 @@ export class WebSocketService {
     private onPlayerJoined: ((player: OtherPlayer) => void) | null = null;
     private onPlayerLeft: ((playerId: string) => void) | null = null;
     private onPlayerUpdate: ((playerId: string, x: number, y: number, mass: number, radius: number, color?: string) => void) | null = null;
-    private onOtherPlayerSplitsReceived: ((splits: OtherPlayerSplit[]) => void) | null = null;
-    private onOtherPlayerEjectedReceived: ((ejected: OtherPlayerEjected[]) => void) | null = null;
+    private onOtherPlayerSplitsReceived: ((splits: OtherPlayerSplit[], playerIds?: string[]) => void) | null = null;
+    private onOtherPlayerEjectedReceived: ((ejected: OtherPlayerEjected[], playerIds?: string[]) => void) | null = null;
     private onPlayerConsumed: ((targetId: string, targetType: 'player' | 'split', consumerId?: string, newMass?: number, gainedMass?: number, consumingEntityType?: string, consumingEntityId?: string) => void) | null = null;
     private onOtherEjectedConsumed: ((ejectedId: number, consumerId?: string, newMass?: number, gainedMass?: number, consumingEntityType?: string, consumingEntityId?: string, originalOwnerId?: string) => void) | null = null;
 
@@ -98,8 +104,8 @@ export class WebSocketService {
         onPlayerJoined: (player: OtherPlayer) => void,
         onPlayerLeft: (playerId: string) => void,
         onPlayerUpdate: (playerId: string, x: number, y: number, mass: number, radius: number, color?: string) => void,
-        onOtherPlayerSplits: (splits: OtherPlayerSplit[]) => void,
-        onOtherPlayerEjected: (ejected: OtherPlayerEjected[]) => void,
+        onOtherPlayerSplits: (splits: OtherPlayerSplit[], playerIds?: string[]) => void,
+        onOtherPlayerEjected: (ejected: OtherPlayerEjected[], playerIds?: string[]) => void,
         onPlayerConsumed: (targetId: string, targetType: 'player' | 'split', consumerId?: string, newMass?: number, gainedMass?: number, consumingEntityType?: string, consumingEntityId?: string) => void,
         onOtherEjectedConsumed: (ejectedId: number, consumerId?: string, newMass?: number, gainedMass?: number, consumingEntityType?: string, consumingEntityId?: string, originalOwnerId?: string) => void
     ) {
@@ -125,6 +131,8 @@ export class WebSocketService {
         
         try {
             this.ws = new WebSocket(this.url);
+            // Server sends orjson-encoded binary frames
+            this.ws.binaryType = 'arraybuffer';
 
             this.ws.onopen = () => {
                 console.log('Connected to server');
@@ -135,8 +143,16 @@ export class WebSocketService {
             };
 
             this.ws.onmessage = (event) => {
-                const data = JSON.parse(event.data);
-                this.handleMessage(data);
+                if (typeof event.data === 'string') {
+                    this.handleJsonFrame(event.data);
+                    return;
+                }
+                const view = new DataView(event.data);
+                if (view.getUint8(0) === OPCODE_PROJECTILE_UPDATE) {
+                    this.handleProjectileFrame(view);
+                    return;
+                }
+                this.handleJsonFrame(this.decoder.decode(event.data));
             };
 
             this.ws.onclose = (event) => {
@@ -198,6 +214,43 @@ export class WebSocketService {
         }
     }
 
+    private handleJsonFrame(text: string) {
+        const data = JSON.parse(text);
+        // The server coalesces queued messages into a single array frame
+        if (Array.isArray(data)) {
+            for (const message of data) {
+                this.handleMessage(message);
+            }
+        } else {
+            this.handleMessage(data);
+        }
+    }
+
+    private handleProjectileFrame(view: DataView) {
+        if (!this.onProjectileUpdates) {
+            return;
+        }
+        const count = view.getUint16(1, true);
+        const updates: { type: string; projectile: ServerVirusProjectile }[] = [];
+        let offset = PROJECTILE_HEADER_SIZE;
+        for (let i = 0; i < count; i++) {
+            updates.push({
+                type: 'projectile_update',
+                projectile: {
+                    id: view.getUint32(offset, true),
+                    x: view.getFloat32(offset + 4, true),
+                    y: view.getFloat32(offset + 8, true),
+                    vx: view.getFloat32(offset + 12, true),
+                    vy: view.getFloat32(offset + 16, true),
+                    travelled: view.getFloat32(offset + 20, true),
+                    mass: view.getFloat32(offset + 24, true)
+                }
+            });
+            offset += PROJECTILE_ENTRY_SIZE;
+        }
+        this.onProjectileUpdates(updates);
+    }
+
     private handleMessage(data: any) {
         switch (data.type) {
             case 'init':
@@ -241,7 +294,10 @@ export class WebSocketService {
                     this.onVirusProjectilesReceived(projectiles);
                 }
                 if (this.onOtherPlayersReceived && data.players) {
-                    this.onOtherPlayersReceived(data.players);
+                    // The server sends every player, including this one
+                    this.onOtherPlayersReceived(
+                        data.players.filter((p: OtherPlayer) => p.id !== data.playerId)
+                    );
                 }
                 if (this.onOtherPlayerSplitsReceived && data.playerSplits) {
                     this.onOtherPlayerSplitsReceived(data.playerSplits);
@@ -275,6 +331,36 @@ export class WebSocketService {
                 }
                 break;
             
+            case 'batch_player_updates': {
+                // Players that moved out of view; drop them like a leave
+                if (this.onPlayerLeft && data.left) {
+                    for (const playerId of data.left) {
+                        this.onPlayerLeft(playerId);
+                    }
+                }
+                // Players that moved into view come with their full state
+                if (this.onPlayerJoined && data.entered) {
+                    for (const player of data.entered) {
+                        this.onPlayerJoined(player);
+                    }
+                }
+                if (this.onPlayerUpdate) {
+                    for (const update of data.updates) {
+                        this.onPlayerUpdate(update.playerId, update.x, update.y, update.mass, update.radius, update.color);
+                    }
+                }
+                // Splits/ejected only cover the players in this batch
+                const playerIds = data.updates.map((update: any) => update.playerId)
+                    .concat((data.entered || []).map((player: any) => player.id));
+                if (this.onOtherPlayerSplitsReceived && data.splits) {
+                    this.onOtherPlayerSplitsReceived(data.splits, playerIds);
+                }
+                if (this.onOtherPlayerEjectedReceived && data.ejected) {
+                    this.onOtherPlayerEjectedReceived(data.ejected, playerIds);
+                }
+                break;
+            }
+            
             case 'pellet_update':
                 if (this.onPelletUpdate) {
                     this.onPelletUpdate(data.consumed, data.spawned);
@@ -1,9 +1,11 @@
 # server/api/routes.py
 """API routes for the game server."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
 from services.game_service import GameService
-from config.settings import get_game_config
+from config.settings import GAME_CONFIG_BYTES
+from utils.helpers import encode_with_raw_fields
 
 
 class GameAPI:
@@ -15,7 +17,11 @@ class GameAPI:
         self._setup_routes()
 
     def _setup_routes(self):
-        """Set up all API routes."""
+        """Set up all API routes.
+
+        Routes return Response objects directly so FastAPI skips its
+        jsonable_encoder pass over the (potentially large) entity lists.
+        """
 
         @self.router.get("/")
         async def root():
@@ -25,29 +31,39 @@ class GameAPI:
         @self.router.get("/api/game/config")
         async def get_game_config_endpoint():
             """Get game configuration including world size, grid size, etc."""
-            return get_game_config()
+            return Response(content=GAME_CONFIG_BYTES, media_type="application/json")
 
         @self.router.get("/api/game/pellets")
         async def get_pellets():
             """Get all current pellets."""
-            return {"pellets": self.game_service.get_all_pellets()}
+            return Response(
+                content=encode_with_raw_fields(
+                    {}, pellets=self.game_service.get_pellets_json()
+                ),
+                media_type="application/json",
+            )
 
         @self.router.get("/api/game/viruses")
         async def get_viruses():
             """Get all current viruses and projectiles."""
-            return {
-                "viruses": self.game_service.get_all_viruses(),
-                "projectiles": self.game_service.get_all_virus_projectiles(),
-            }
+            return Response(
+                content=encode_with_raw_fields(
+                    {"projectiles": self.game_service.get_all_virus_projectiles()},
+                    viruses=self.game_service.get_viruses_json(),
+                ),
+                media_type="application/json",
+            )
 
         @self.router.get("/api/game/players")
         async def get_players():
             """Get all current players."""
-            return {
-                "players": self.game_service.get_all_players(),
-                "splits": self.game_service.get_all_player_splits(),
-                "ejected": self.game_service.get_all_player_ejected(),
-            }
+            return ORJSONResponse(
+                {
+                    "players": self.game_service.get_all_players(),
+                    "splits": self.game_service.get_all_player_splits(),
+                    "ejected": self.game_service.get_all_player_ejected(),
+                }
+            )
 
         @self.router.get("/api/game/stats")
         async def get_game_stats():
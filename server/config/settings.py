@@ -1,6 +1,10 @@
 # server/config/settings.py
 """Game configuration constants and settings."""
 
+import math
+
+import orjson
+
 # World settings
 WORLD_SIZE = 11000
 GRID_SIZE = 50
@@ -21,6 +25,17 @@ VIRUS_FEEDS_TO_SPLIT = 7
 VIRUS_PROJECTILE_SPEED = 350
 VIRUS_PROJECTILE_RANGE = 350
 
+# Derived virus geometry (projectiles always carry VIRUS_MASS)
+VIRUS_RADIUS = PELLET_RADIUS * math.sqrt(VIRUS_MASS)
+VIRUS_EDGE_MIN = VIRUS_RADIUS
+VIRUS_EDGE_MAX = WORLD_SIZE - VIRUS_RADIUS
+VIRUS_MIN_SPACING = VIRUS_RADIUS * 3
+VIRUS_MIN_SPACING_SQ = VIRUS_MIN_SPACING * VIRUS_MIN_SPACING
+VIRUS_SPAWN_SPAN = VIRUS_EDGE_MAX - VIRUS_EDGE_MIN
+
+# Derived pellet spawn range
+PELLET_SPAWN_SPAN = WORLD_SIZE - 2 * PELLET_RADIUS
+
 # Ejection settings
 EJECT_THRESHOLD = 35
 EJECT_LOSS = 18
@@ -36,11 +51,16 @@ MERGE_SPEED = 100
 
 # Player settings
 START_MASS = 25
+START_RADIUS = PELLET_RADIUS * math.sqrt(START_MASS)
 DECAY_RATE = 0.002
 
 # Server settings
 UPDATE_RATE = 60  # FPS for projectile updates
+MAX_CATCHUP_STEPS = 5  # physics steps per wakeup before lag is dropped
 WEBSOCKET_UPDATE_INTERVAL = 50  # ms
+CLIENT_OUTBOX_SIZE = 256  # queued frames per client before it is dropped
+CLIENT_SEND_TIMEOUT = 5.0  # seconds one send may block before the client is dropped
+INTEREST_RADIUS = 4000  # world units; wider than the most zoomed-out viewport
 
 
 def get_game_config():
@@ -72,3 +92,8 @@ def get_game_config():
         "startMass": START_MASS,
         "decayRate": DECAY_RATE,
     }
+
+
+# The configuration is immutable, so build it and its JSON encoding once
+GAME_CONFIG = get_game_config()
+GAME_CONFIG_BYTES = orjson.dumps(GAME_CONFIG)
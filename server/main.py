@@ -3,6 +3,7 @@
 
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from services.game_service import GameService
 from services.websocket_service import WebSocketService
@@ -15,6 +16,7 @@ def create_app() -> FastAPI:
         title="Agario Server",
         description="Real-time multiplayer Agar.io clone server",
         version="1.0.0",
+        default_response_class=ORJSONResponse,
     )
 
     # Add CORS middleware
@@ -63,6 +65,20 @@ async def websocket_endpoint(websocket: WebSocket):
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    # Development entry point. In production run without reload:
+    #   uvicorn main:app --loop uvloop --http httptools --ws websockets
+    # Game state lives in this process, so keep a single worker.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        log_level="info",
+        # uvloop is not available on Windows; fall back to asyncio there
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        ws="websockets",
+    )
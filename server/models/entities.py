@@ -2,10 +2,10 @@
 """Game entity models and data classes."""
 
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Player:
     """Represents a player in the game."""
 
@@ -16,12 +16,23 @@ class Player:
     radius: float
     color: str
 
+    def to_dict(self) -> dict:
+        """Convert the player to a dictionary."""
+        return {
+            "id": self.id,
+            "x": self.x,
+            "y": self.y,
+            "mass": self.mass,
+            "radius": self.radius,
+            "color": self.color,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class PlayerSplit:
     """Represents a split part of a player."""
 
-    id: Union[str, int]  # Can be either string (new) or int (legacy)
+    id: str
     playerId: str
     x: float
     y: float
@@ -31,8 +42,22 @@ class PlayerSplit:
     born: int
     mergeDelay: float
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Convert the split to a dictionary."""
+        return {
+            "id": self.id,
+            "playerId": self.playerId,
+            "x": self.x,
+            "y": self.y,
+            "vx": self.vx,
+            "vy": self.vy,
+            "mass": self.mass,
+            "born": self.born,
+            "mergeDelay": self.mergeDelay,
+        }
+
+
+@dataclass(slots=True)
 class PlayerEjected:
     """Represents ejected mass from a player."""
 
@@ -45,8 +70,21 @@ class PlayerEjected:
     travelled: float
     mass: float
 
-
-@dataclass
+    def to_dict(self) -> dict:
+        """Convert the ejected mass to a dictionary."""
+        return {
+            "id": self.id,
+            "playerId": self.playerId,
+            "x": self.x,
+            "y": self.y,
+            "vx": self.vx,
+            "vy": self.vy,
+            "travelled": self.travelled,
+            "mass": self.mass,
+        }
+
+
+@dataclass(slots=True)
 class Pellet:
     """Represents a food pellet in the game."""
 
@@ -56,8 +94,18 @@ class Pellet:
     mass: int
     color: str
 
+    def to_dict(self) -> dict:
+        """Convert the pellet to a dictionary."""
+        return {
+            "id": self.id,
+            "x": self.x,
+            "y": self.y,
+            "mass": self.mass,
+            "color": self.color,
+        }
 
-@dataclass
+
+@dataclass(slots=True)
 class Virus:
     """Represents a virus entity that can split players."""
 
@@ -68,8 +116,19 @@ class Virus:
     feedCount: int
     lastFeedAngle: Optional[float] = None
 
+    def to_dict(self) -> dict:
+        """Convert the virus to a dictionary."""
+        return {
+            "id": self.id,
+            "x": self.x,
+            "y": self.y,
+            "mass": self.mass,
+            "feedCount": self.feedCount,
+            "lastFeedAngle": self.lastFeedAngle,
+        }
+
 
-@dataclass
+@dataclass(slots=True)
 class VirusProjectile:
     """Represents a projectile spawned when a virus splits."""
 
@@ -79,4 +138,16 @@ class VirusProjectile:
     vx: float
     vy: float
     travelled: float
-    mass: float
\ No newline at end of file
+    mass: float
+
+    def to_dict(self) -> dict:
+        """Convert the projectile to a dictionary."""
+        return {
+            "id": self.id,
+            "x": self.x,
+            "y": self.y,
+            "vx": self.vx,
+            "vy": self.vy,
+            "travelled": self.travelled,
+            "mass": self.mass,
+        }
@@ -4,8 +4,9 @@
 import random
 import math
 import uuid
-from typing import Dict, List, Optional
-from dataclasses import asdict
+import orjson
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
 
 from models.entities import (
     Player,
@@ -16,7 +17,12 @@ from models.entities import (
     VirusProjectile,
 )
 from config.settings import *
-from utils.helpers import calculate_radius
+from utils.helpers import (
+    calculate_radius,
+    calculate_radius_squared,
+    HSL_PALETTE,
+    HSL_PALETTE_BITS,
+)
 
 
 class GameService:
@@ -24,18 +30,42 @@ class GameService:
 
     def __init__(self):
         self.pellets: Dict[int, Pellet] = {}
+        # Pellets never change after spawning, so serialize each one once
+        self._pellet_dicts: Dict[int, dict] = {}
         self.viruses: Dict[int, Virus] = {}
         self.virus_projectiles: Dict[int, VirusProjectile] = {}
         self.players: Dict[str, Player] = {}
         self.player_splits: Dict[str, PlayerSplit] = {}  # Changed to store by split ID
         self.player_ejected: Dict[int, PlayerEjected] = {}
 
+        # Reverse indexes so per-player cleanup doesn't scan every entity
+        self.splits_by_player: Dict[str, Set[str]] = defaultdict(set)
+        self.ejected_by_player: Dict[str, Set[int]] = defaultdict(set)
+
+        # Uniform grid of virus IDs for the spawn overlap check
+        self._virus_grid: Dict[Tuple[int, int], List[int]] = {}
+
+        # Private generator; random() arithmetic is cheaper than uniform/randint
+        self._rng = random.Random()
+
         # ID generators
         self.next_pellet_id = 0
         self.next_virus_id = 0
         self.next_projectile_id = 0
         self.next_ejected_id = 0
 
+        # consume_player dispatch by target type
+        self._target_handlers = {
+            "player": self._consume_target_player,
+            "split": self._consume_target_split,
+        }
+
+        # Serialized snapshots, cleared whenever the collection changes
+        self._pellets_snapshot: Optional[List[dict]] = None
+        self._pellets_json: Optional[bytes] = None
+        self._viruses_snapshot: Optional[List[dict]] = None
+        self._viruses_json: Optional[bytes] = None
+
         self._initialize_world()
 
     def _initialize_world(self):
@@ -45,8 +75,7 @@ class GameService:
 
     def _initialize_pellets(self):
         """Initialize pellets with random positions."""
-        for _ in range(PELLET_COUNT):
-            self._spawn_pellet()
+        self._spawn_pellets(PELLET_COUNT)
 
     def _initialize_viruses(self):
         """Initialize viruses with random positions."""
@@ -55,62 +84,86 @@ class GameService:
 
     def _spawn_pellet(self) -> Pellet:
         """Spawn a single pellet at a random position."""
-        pellet_id = self.next_pellet_id
-        self.next_pellet_id += 1
-
-        pellet = Pellet(
-            id=pellet_id,
-            x=random.uniform(PELLET_RADIUS, WORLD_SIZE - PELLET_RADIUS),
-            y=random.uniform(PELLET_RADIUS, WORLD_SIZE - PELLET_RADIUS),
-            mass=random.randint(1, 5),
-            color=f"hsl({random.randint(0, 360)},70%,60%)",
-        )
-        self.pellets[pellet_id] = pellet
-        return pellet
+        return self._spawn_pellets(1)[0]
+
+    def _spawn_pellets(self, count: int) -> List[Pellet]:
+        """Spawn a batch of pellets at random positions."""
+        start = self.next_pellet_id
+        self.next_pellet_id += count
+
+        # Hoist lookups out of the loop; matters for the startup burst
+        rand = self._rng.random
+        getrandbits = self._rng.getrandbits
+        pellets = self.pellets
+        pellet_dicts = self._pellet_dicts
+
+        spawned = []
+        for pellet_id in range(start, start + count):
+            pellet = Pellet(
+                id=pellet_id,
+                x=PELLET_RADIUS + rand() * PELLET_SPAWN_SPAN,
+                y=PELLET_RADIUS + rand() * PELLET_SPAWN_SPAN,
+                mass=1 + int(rand() * 5),
+                color=HSL_PALETTE[getrandbits(HSL_PALETTE_BITS)],
+            )
+            pellets[pellet_id] = pellet
+            pellet_dicts[pellet_id] = pellet.to_dict()
+            spawned.append(pellet)
 
-    def _spawn_virus(self, existing_viruses: List[Virus] = None) -> Virus:
-        """Spawn a single virus avoiding overlap with existing ones."""
-        if existing_viruses is None:
-            existing_viruses = list(self.viruses.values())
+        self._invalidate_pellets()
+        return spawned
 
-        virus_radius = calculate_radius(VIRUS_MASS)
+    def _spawn_virus(self) -> Virus:
+        """Spawn a single virus avoiding overlap with existing ones."""
+        rand = self._rng.random
 
         # Try to find a valid position
         for _ in range(50):  # Max attempts
-            x = random.uniform(virus_radius, WORLD_SIZE - virus_radius)
-            y = random.uniform(virus_radius, WORLD_SIZE - virus_radius)
+            x = VIRUS_EDGE_MIN + rand() * VIRUS_SPAWN_SPAN
+            y = VIRUS_EDGE_MIN + rand() * VIRUS_SPAWN_SPAN
 
             # Check distance from other viruses
-            valid = True
-            for v in existing_viruses:
-                if math.hypot(v.x - x, v.y - y) < virus_radius * 3:
-                    valid = False
-                    break
-
-            if valid:
+            if not self._overlaps_virus(x, y):
                 break
         else:
             # Fallback if no valid position found
-            x = random.uniform(virus_radius, WORLD_SIZE - virus_radius)
-            y = random.uniform(virus_radius, WORLD_SIZE - virus_radius)
+            x = VIRUS_EDGE_MIN + rand() * VIRUS_SPAWN_SPAN
+            y = VIRUS_EDGE_MIN + rand() * VIRUS_SPAWN_SPAN
+
+        return self._add_virus(x, y)
 
+    def _add_virus(self, x: float, y: float) -> Virus:
+        """Create a virus at a known position."""
         virus_id = self.next_virus_id
         self.next_virus_id += 1
 
         virus = Virus(id=virus_id, x=x, y=y, mass=VIRUS_MASS, feedCount=0)
         self.viruses[virus_id] = virus
+        self._virus_grid.setdefault(self._virus_cell(x, y), []).append(virus_id)
+        self._invalidate_viruses()
+        return virus
+
+    def _remove_virus(self, virus_id: int) -> Virus:
+        """Remove a virus and drop it from the grid."""
+        virus = self.viruses.pop(virus_id)
+        cell = self._virus_cell(virus.x, virus.y)
+        self._virus_grid[cell].remove(virus_id)
+        if not self._virus_grid[cell]:
+            del self._virus_grid[cell]
+        self._invalidate_viruses()
         return virus
 
     def create_player(self) -> Player:
         """Create a new player with random position and color."""
         player_id = str(uuid.uuid4())
+        rand = self._rng.random
         player = Player(
             id=player_id,
-            x=random.uniform(100, WORLD_SIZE - 100),
-            y=random.uniform(100, WORLD_SIZE - 100),
+            x=100 + rand() * (WORLD_SIZE - 200),
+            y=100 + rand() * (WORLD_SIZE - 200),
             mass=START_MASS,
-            radius=calculate_radius(START_MASS),
-            color=f"hsl({random.randint(0, 360)},70%,60%)",
+            radius=START_RADIUS,
+            color=HSL_PALETTE[self._rng.getrandbits(HSL_PALETTE_BITS)],
         )
         self.players[player_id] = player
         return player
@@ -121,21 +174,9 @@ class GameService:
         if player_id in self.players:
             del self.players[player_id]
 
-        # Remove player's splits
-        splits_to_remove = [
-            id
-            for id, split in self.player_splits.items()
-            if split.playerId == player_id
-        ]
-        for split_id in splits_to_remove:
-            del self.player_splits[split_id]
-
-        # Remove player's ejected mass
-        ejected_to_remove = [
-            id for id, ej in self.player_ejected.items() if ej.playerId == player_id
-        ]
-        for ej_id in ejected_to_remove:
-            del self.player_ejected[ej_id]
+        # Remove player's splits and ejected mass
+        self._clear_player_splits(player_id)
+        self._clear_player_ejected(player_id)
 
     def update_player(
         self,
@@ -157,41 +198,53 @@ class GameService:
                 player.color = color
 
     def update_player_splits(self, player_id: str, splits_data: List[dict]):
-        """Update player's split blobs."""
-        # Remove old splits for this player
-        splits_to_remove = [
-            id
-            for id, split in self.player_splits.items()
-            if split.playerId == player_id
-        ]
-        for split_id in splits_to_remove:
-            del self.player_splits[split_id]
-
-        # Add new splits with their client-provided IDs
-        for split_data in splits_data:
-            split_id = split_data.get("id", f"split-{player_id}-{len(self.player_splits)}")
-            
-            split = PlayerSplit(
-                id=split_id,
-                playerId=player_id,
-                x=split_data["x"],
-                y=split_data["y"],
-                vx=split_data.get("vx", 0),
-                vy=split_data.get("vy", 0),
-                mass=split_data["mass"],
-                born=split_data.get("born", 0),
-                mergeDelay=split_data.get("mergeDelay", 0),
-            )
-            self.player_splits[split_id] = split
+        """Update player's split blobs in place, matched by client-provided ID."""
+        previous_ids = self.splits_by_player[player_id]
+        split_ids = set()
+
+        for i, split_data in enumerate(splits_data):
+            split_id = split_data.get("id")
+            if split_id is None:
+                # Position in the message, so the fallback is stable across updates
+                split_id = f"split-{player_id}-{i}"
+            # Store and key by string so a client-sent targetId matches directly
+            split_id = str(split_id)
+
+            split = self._owned_split(player_id, split_id)
+            if split is not None:
+                # Same blob as last update: refresh it rather than reallocate
+                split.x = split_data["x"]
+                split.y = split_data["y"]
+                split.vx = split_data.get("vx", 0)
+                split.vy = split_data.get("vy", 0)
+                split.mass = split_data["mass"]
+                split.born = split_data.get("born", 0)
+                split.mergeDelay = split_data.get("mergeDelay", 0)
+            else:
+                self.player_splits[split_id] = PlayerSplit(
+                    id=split_id,
+                    playerId=player_id,
+                    x=split_data["x"],
+                    y=split_data["y"],
+                    vx=split_data.get("vx", 0),
+                    vy=split_data.get("vy", 0),
+                    mass=split_data["mass"],
+                    born=split_data.get("born", 0),
+                    mergeDelay=split_data.get("mergeDelay", 0),
+                )
+            split_ids.add(split_id)
+
+        # Drop splits that merged back or were eaten since the last update
+        for split_id in previous_ids - split_ids:
+            if self._owned_split(player_id, split_id) is not None:
+                self.player_splits.pop(split_id, None)
+        self.splits_by_player[player_id] = split_ids
 
     def update_player_ejected(self, player_id: str, ejected_data: List[dict]):
         """Update player's ejected mass."""
         # Remove old ejected for this player
-        ejected_to_remove = [
-            id for id, ej in self.player_ejected.items() if ej.playerId == player_id
-        ]
-        for ej_id in ejected_to_remove:
-            del self.player_ejected[ej_id]
+        self._clear_player_ejected(player_id)
+        ejected_ids = self.ejected_by_player[player_id]
 
         # Add new ejected
         for ej_data in ejected_data:
@@ -209,13 +262,19 @@ class GameService:
                 mass=ej_data["mass"],
             )
             self.player_ejected[ej_id] = ejected
+            ejected_ids.add(ej_id)
 
     def consume_pellet(self, pellet_id: int) -> Optional[dict]:
         """Handle pellet consumption and spawn a new one."""
         if pellet_id in self.pellets:
             del self.pellets[pellet_id]
+            del self._pellet_dicts[pellet_id]
+            self._invalidate_pellets()
             new_pellet = self._spawn_pellet()
-            return {"consumed": pellet_id, "spawned": asdict(new_pellet)}
+            return {
+                "consumed": pellet_id,
+                "spawned": self._pellet_dicts[new_pellet.id],
+            }
         return None
 
     def feed_virus(self, virus_id: int, feed_angle: float) -> Optional[dict]:
@@ -227,6 +286,7 @@ class GameService:
         virus.lastFeedAngle = feed_angle
         virus.feedCount += 1
         virus.mass += VIRUS_FEED_MASS
+        self._invalidate_viruses()
 
         result = {"virusId": virus_id, "newMass": virus.mass}
 
@@ -255,16 +315,16 @@ class GameService:
             virus.feedCount = 0
             virus.lastFeedAngle = None
 
-            result["projectileSpawned"] = asdict(projectile)
+            result["projectileSpawned"] = projectile.to_dict()
 
         return result
 
     def consume_virus(self, virus_id: int) -> Optional[dict]:
         """Handle virus consumption and spawn a new one."""
         if virus_id in self.viruses:
-            del self.viruses[virus_id]
+            self._remove_virus(virus_id)
             new_virus = self._spawn_virus()
-            return {"consumed": virus_id, "spawned": asdict(new_virus)}
+            return {"consumed": virus_id, "spawned": new_virus.to_dict()}
         return None
 
     def consume_player(
@@ -291,28 +351,19 @@ class GameService:
         if consuming_mass == 0:
             return None
 
-        if target_type == "player":
-            return self._consume_target_player(
-                consumer,
-                target_id,
-                consuming_mass,
-                consuming_x,
-                consuming_y,
-                consuming_entity_type,
-                consuming_entity_id,
-            )
-        elif target_type == "split":
-            return self._consume_target_split(
-                consumer,
-                target_id,
-                consuming_mass,
-                consuming_x,
-                consuming_y,
-                consuming_entity_type,
-                consuming_entity_id,
-            )
+        handler = self._target_handlers.get(target_type)
+        if handler is None:
+            return None
 
-        return None
+        return handler(
+            consumer,
+            target_id,
+            consuming_mass,
+            consuming_x,
+            consuming_y,
+            consuming_entity_type,
+            consuming_entity_id,
+        )
 
     def consume_other_ejected(
         self,
@@ -342,14 +393,14 @@ class GameService:
             )
         )
 
-        distance = math.hypot(
-            consuming_x - target_ejected.x, consuming_y - target_ejected.y
-        )
-        if distance >= consuming_radius:
+        dx = consuming_x - target_ejected.x
+        dy = consuming_y - target_ejected.y
+        if dx * dx + dy * dy >= consuming_radius * consuming_radius:
             return None
 
         # Remove the ejected mass first to prevent double consumption
         del self.player_ejected[ejected_id]
+        self.ejected_by_player[target_ejected.playerId].discard(ejected_id)
 
         # Calculate new mass
         gained_mass = EJECT_MASS_GAIN
@@ -372,55 +423,119 @@ class GameService:
             "originalOwnerId": target_ejected.playerId,
         }
 
-    async def update_virus_projectiles(self, dt: float) -> List[dict]:
-        """Update virus projectile positions and convert to viruses when needed."""
+    def update_virus_projectiles(
+        self, dt: float
+    ) -> Tuple[List[VirusProjectile], List[dict]]:
+        """Update virus projectile positions and convert to viruses when needed.
+
+        Returns the projectiles still in flight and the conversion events for
+        projectiles that turned into viruses this tick.
+        """
+        if not self.virus_projectiles:
+            return [], []
+
+        moved = []
         updates = []
         to_remove = []
 
+        # Every projectile flies at VIRUS_PROJECTILE_SPEED, so the distance
+        # covered this tick is the same for all of them and needs no sqrt
+        step = VIRUS_PROJECTILE_SPEED * dt
+
         for proj_id, proj in self.virus_projectiles.items():
             # Update position
-            mvx = proj.vx * dt
-            mvy = proj.vy * dt
-            proj.x += mvx
-            proj.y += mvy
-            proj.travelled += math.hypot(mvx, mvy)
+            proj.x += proj.vx * dt
+            proj.y += proj.vy * dt
+            proj.travelled += step
 
             # Check if projectile should convert to virus
-            proj_radius = calculate_radius(proj.mass)
-
             if (
                 proj.travelled >= VIRUS_PROJECTILE_RANGE
-                or proj.x <= proj_radius
-                or proj.x >= WORLD_SIZE - proj_radius
-                or proj.y <= proj_radius
-                or proj.y >= WORLD_SIZE - proj_radius
+                or proj.x <= VIRUS_EDGE_MIN
+                or proj.x >= VIRUS_EDGE_MAX
+                or proj.y <= VIRUS_EDGE_MIN
+                or proj.y >= VIRUS_EDGE_MAX
             ):
 
-                # Convert to virus
-                new_virus = self._spawn_virus()
-                new_virus.x = max(proj_radius, min(WORLD_SIZE - proj_radius, proj.x))
-                new_virus.y = max(proj_radius, min(WORLD_SIZE - proj_radius, proj.y))
+                # Convert to virus where the projectile landed, no placement search
+                new_virus = self._add_virus(
+                    max(VIRUS_EDGE_MIN, min(VIRUS_EDGE_MAX, proj.x)),
+                    max(VIRUS_EDGE_MIN, min(VIRUS_EDGE_MAX, proj.y)),
+                )
 
                 to_remove.append(proj_id)
                 updates.append(
                     {
                         "type": "projectile_to_virus",
                         "projectileId": proj_id,
-                        "virus": asdict(new_virus),
+                        "virus": new_virus.to_dict(),
                     }
                 )
             else:
-                updates.append(
-                    {"type": "projectile_update", "projectile": asdict(proj)}
-                )
+                moved.append(proj)
 
         # Remove converted projectiles
         for proj_id in to_remove:
             del self.virus_projectiles[proj_id]
 
-        return updates
+        return moved, updates
 
     # Helper methods
+    def _clear_player_splits(self, player_id: str):
+        """Remove every split owned by a player."""
+        for split_id in self.splits_by_player.pop(player_id, ()):
+            if self._owned_split(player_id, split_id) is not None:
+                self.player_splits.pop(split_id, None)
+
+    def _owned_split(self, player_id: str, split_id: str) -> Optional[PlayerSplit]:
+        """Get a split only if the player still owns it."""
+        split = self.player_splits.get(split_id)
+        # A colliding client ID may have been taken over by another player
+        if split is not None and split.playerId == player_id:
+            return split
+        return None
+
+    def _clear_player_ejected(self, player_id: str):
+        """Remove every ejected mass owned by a player."""
+        for ej_id in self.ejected_by_player.pop(player_id, ()):
+            self.player_ejected.pop(ej_id, None)
+
+    def _overlaps_virus(self, x: float, y: float) -> bool:
+        """Check if a position is within VIRUS_MIN_SPACING of any virus."""
+        for v in self._nearby_viruses(x, y):
+            vx = v.x - x
+            vy = v.y - y
+            if vx * vx + vy * vy < VIRUS_MIN_SPACING_SQ:
+                return True
+        return False
+
+    def _nearby_viruses(self, x: float, y: float):
+        """Yield viruses in the grid cells around a position.
+
+        Covers every virus within VIRUS_MIN_SPACING of the position, since
+        cells are that wide; callers do the exact distance test.
+        """
+        cx, cy = self._virus_cell(x, y)
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for virus_id in self._virus_grid.get((cx + dx, cy + dy), ()):
+                    yield self.viruses[virus_id]
+
+    @staticmethod
+    def _virus_cell(x: float, y: float) -> Tuple[int, int]:
+        """Get the virus grid cell containing a position."""
+        return int(x // VIRUS_MIN_SPACING), int(y // VIRUS_MIN_SPACING)
+
+    def _invalidate_pellets(self):
+        """Drop cached pellet snapshots after the pellets change."""
+        self._pellets_snapshot = None
+        self._pellets_json = None
+
+    def _invalidate_viruses(self):
+        """Drop cached virus snapshots after the viruses change."""
+        self._viruses_snapshot = None
+        self._viruses_json = None
+
     def _get_consuming_entity_data(
         self, consumer: Player, consuming_entity_type: str, consuming_entity_id: str, consuming_entity_data: dict
     ) -> tuple:
@@ -468,9 +583,11 @@ class GameService:
         target = self.players[target_id]
 
         # Validate size advantage and collision
-        if consuming_mass < target.mass * 1.1 or math.hypot(
-            consuming_x - target.x, consuming_y - target.y
-        ) >= calculate_radius(consuming_mass):
+        dx = consuming_x - target.x
+        dy = consuming_y - target.y
+        if consuming_mass < target.mass * 1.1 or dx * dx + dy * dy >= (
+            calculate_radius_squared(consuming_mass)
+        ):
             return None
 
         gained_mass = target.mass
@@ -507,24 +624,18 @@ class GameService:
         consuming_entity_id: str,
     ) -> Optional[dict]:
         """Handle consuming a target split."""
-        # Find the split by ID (all splits should use string IDs now)
+        # Splits are keyed by their string ID, so this is a direct lookup
+        target_id = str(target_id)
         target_split = self.player_splits.get(target_id)
-        
-        if not target_split:
-            # Try to find by matching the split's stored ID
-            for split_id, split in self.player_splits.items():
-                if str(split.id) == target_id:
-                    target_split = split
-                    target_id = split_id  # Use the key as the actual ID
-                    break
-        
         if not target_split:
             return None
 
         # Validate size advantage and collision
-        if consuming_mass < target_split.mass * 1.1 or math.hypot(
-            consuming_x - target_split.x, consuming_y - target_split.y
-        ) >= calculate_radius(consuming_mass):
+        dx = consuming_x - target_split.x
+        dy = consuming_y - target_split.y
+        if consuming_mass < target_split.mass * 1.1 or dx * dx + dy * dy >= (
+            calculate_radius_squared(consuming_mass)
+        ):
             return None
 
         gained_mass = target_split.mass
@@ -537,9 +648,9 @@ class GameService:
         else:
             new_mass = consuming_mass + gained_mass
 
-        # Remove the split - use the correct key
-        if target_id in self.player_splits:
-            del self.player_splits[target_id]
+        # Remove the split
+        del self.player_splits[target_id]
+        self.splits_by_player[target_split.playerId].discard(target_id)
 
         return {
             "targetId": target_id,
@@ -552,32 +663,61 @@ class GameService:
         }
     # Getter methods for game state
     def get_all_pellets(self) -> List[dict]:
-        """Get all pellets as dictionaries."""
-        return [asdict(pellet) for pellet in self.pellets.values()]
+        """Get all pellets as dictionaries (cached, do not mutate)."""
+        if self._pellets_snapshot is None:
+            self._pellets_snapshot = list(self._pellet_dicts.values())
+        return self._pellets_snapshot
+
+    def get_pellets_json(self) -> bytes:
+        """Get all pellets as a cached, pre-encoded JSON array."""
+        if self._pellets_json is None:
+            self._pellets_json = orjson.dumps(self.get_all_pellets())
+        return self._pellets_json
 
     def get_all_viruses(self) -> List[dict]:
-        """Get all viruses as dictionaries."""
-        return [asdict(virus) for virus in self.viruses.values()]
+        """Get all viruses as dictionaries (cached, do not mutate)."""
+        if self._viruses_snapshot is None:
+            self._viruses_snapshot = [
+                virus.to_dict() for virus in self.viruses.values()
+            ]
+        return self._viruses_snapshot
+
+    def get_viruses_json(self) -> bytes:
+        """Get all viruses as a cached, pre-encoded JSON array."""
+        if self._viruses_json is None:
+            self._viruses_json = orjson.dumps(self.get_all_viruses())
+        return self._viruses_json
 
     def get_all_virus_projectiles(self) -> List[dict]:
         """Get all virus projectiles as dictionaries."""
-        return [asdict(proj) for proj in self.virus_projectiles.values()]
+        return [proj.to_dict() for proj in self.virus_projectiles.values()]
 
     def get_all_players(self) -> List[dict]:
         """Get all players as dictionaries."""
-        return [asdict(player) for player in self.players.values()]
+        return [player.to_dict() for player in self.players.values()]
 
     def get_all_player_splits(self) -> List[dict]:
-        """Get all player splits as dictionaries, converting to format expected by client."""
-        splits = []
-        for split in self.player_splits.values():
-            split_dict = asdict(split)
-            # For backward compatibility, ensure numeric ID if client expects it
-            if 'id' not in split_dict or not isinstance(split_dict['id'], (int, str)):
-                split_dict['id'] = hash(split.id) % 1000000  # Create a numeric ID from string
-            splits.append(split_dict)
-        return splits
+        """Get all player splits as dictionaries."""
+        return [split.to_dict() for split in self.player_splits.values()]
 
     def get_all_player_ejected(self) -> List[dict]:
         """Get all player ejected mass as dictionaries."""
-        return [asdict(ej) for ej in self.player_ejected.values()]
\ No newline at end of file
+        return [ej.to_dict() for ej in self.player_ejected.values()]
+
+    def get_player_splits(self, player_ids) -> List[dict]:
+        """Get the splits owned by the given players as dictionaries."""
+        splits = []
+        for player_id in player_ids:
+            for split_id in self.splits_by_player.get(player_id, ()):
+                split = self._owned_split(player_id, split_id)
+                if split is not None:
+                    splits.append(split.to_dict())
+        return splits
+
+    def get_player_ejected(self, player_ids) -> List[dict]:
+        """Get the ejected mass owned by the given players as dictionaries."""
+        ejected = []
+        for player_id in player_ids:
+            for ej_id in self.ejected_by_player.get(player_id, ()):
+                ejected.append(self.player_ejected[ej_id].to_dict())
+        return ejected
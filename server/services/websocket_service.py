@@ -2,11 +2,25 @@
 """WebSocket connection management and message handling."""
 
 import asyncio
-from typing import Dict, Set
+import orjson
+from typing import Dict, List, Optional, Set, Tuple
 from fastapi import WebSocket, WebSocketDisconnect
-from dataclasses import asdict
+from fastapi.websockets import WebSocketState
 from .game_service import GameService
-from config.settings import get_game_config, UPDATE_RATE
+from config.settings import (
+    GAME_CONFIG_BYTES,
+    UPDATE_RATE,
+    MAX_CATCHUP_STEPS,
+    WEBSOCKET_UPDATE_INTERVAL,
+    CLIENT_OUTBOX_SIZE,
+    CLIENT_SEND_TIMEOUT,
+    INTEREST_RADIUS,
+)
+from utils.helpers import (
+    coalesce_json_frames,
+    encode_with_raw_fields,
+    pack_projectile_updates,
+)
 
 
 class WebSocketService:
@@ -16,44 +30,195 @@ class WebSocketService:
         self.game_service = game_service
         self.connected_clients: Set[WebSocket] = set()
         self.websocket_to_player: Dict[WebSocket, str] = {}
+        # Per-client outbound queue drained by a dedicated writer task, so a
+        # slow socket never stalls a broadcast to everyone else
+        self._outboxes: Dict[WebSocket, asyncio.Queue] = {}
+        self._writer_tasks: Dict[WebSocket, asyncio.Task] = {}
+        # Closes of dropped clients run detached; keep references until done
+        self._close_tasks: Set[asyncio.Task] = set()
+        # Other players each client currently has, for interest enter/leave
+        self._visible_players: Dict[WebSocket, Set[str]] = {}
+        # Latest player_update per player, flushed as one batch per interval
+        self._pending_player_updates: Dict[str, dict] = {}
+        # _process_message dispatch by message type
+        self._message_handlers = {
+            "player_update": self._handle_player_update,
+            "consume_pellet": self._handle_consume_pellet,
+            "feed_virus": self._handle_feed_virus,
+            "consume_virus": self._handle_consume_virus,
+            "consume_player": self._handle_consume_player,
+            "consume_other_ejected": self._handle_consume_other_ejected,
+        }
         self._update_task = None
+        self._flush_task = None
 
     def start_background_tasks(self):
         """Start background tasks like projectile updates."""
         if not self._update_task:
             self._update_task = asyncio.create_task(self._projectile_update_loop())
+        if not self._flush_task:
+            self._flush_task = asyncio.create_task(self._player_update_flush_loop())
 
     async def _projectile_update_loop(self):
         """Background task to update virus projectiles."""
-        last_update = asyncio.get_event_loop().time()
+        loop = asyncio.get_running_loop()
+        step = 1 / UPDATE_RATE
+        last_update = loop.time()
+        # Fixed-timestep accumulator: physics always advances by `step`, and
+        # sleep jitter is absorbed by running an extra step when it builds up
+        accumulator = 0.0
+        # Timers can fire a hair early (uvloop rounds to milliseconds), so a
+        # step is due once over half of it has built up; the remainder carries
+        due = step / 2
+        next_tick = last_update + step
 
         while True:
-            await asyncio.sleep(1 / UPDATE_RATE)
-            current_time = asyncio.get_event_loop().time()
-            dt = current_time - last_update
+            # Sleep to an absolute deadline so per-sleep overshoot doesn't drift
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            current_time = loop.time()
+            accumulator += current_time - last_update
             last_update = current_time
 
-            updates = await self.game_service.update_virus_projectiles(dt)
+            next_tick += step
+            if next_tick < current_time:
+                # Behind by over a tick; rebase rather than fire back-to-back
+                next_tick = current_time + step
+
+            if accumulator < due:
+                continue
+            # After a long stall, drop the backlog rather than fast-forward
+            accumulator = min(accumulator, step * MAX_CATCHUP_STEPS)
+
+            # Runs inline: the tick is microseconds of work and shares state
+            # with the message handlers, so a worker thread would only add races
+            updates = []
+            while accumulator >= due:
+                moved, converted = self.game_service.update_virus_projectiles(step)
+                updates.extend(converted)
+                accumulator -= step
+
+            if not self.connected_clients:
+                continue
+
+            # Per-tick positions go out as a packed binary frame
+            if moved:
+                await self._broadcast(pack_projectile_updates(moved))
 
-            if updates and self.connected_clients:
+            # Conversions are rare and carry a full virus, so keep them JSON
+            if updates:
                 message = {"type": "projectile_updates", "updates": updates}
                 await self._broadcast_message(message)
 
+    async def _player_update_flush_loop(self):
+        """Background task to broadcast buffered player updates in one frame."""
+        while True:
+            await asyncio.sleep(WEBSOCKET_UPDATE_INTERVAL / 1000)
+
+            if not self._pending_player_updates:
+                continue
+
+            updates = list(self._pending_player_updates.values())
+            self._pending_player_updates.clear()
+
+            if self.connected_clients:
+                await self._broadcast_player_updates(updates)
+
+    async def _broadcast_player_updates(self, updates: List[dict]):
+        """Send each client the batched updates of players near its own.
+
+        Players are bucketed on a grid of INTEREST_RADIUS cells, and every
+        client follows the players in the 3x3 block around its own cell.
+        Players entering that block are sent in full, players leaving it are
+        listed so the client drops them, and the rest get their update.
+        """
+        players = self.game_service.players
+        by_cell: Dict[Tuple[int, int], List[str]] = {}
+        for player_id, player in players.items():
+            cell = self._interest_cell(player.x, player.y)
+            by_cell.setdefault(cell, []).append(player_id)
+        pending = {update["playerId"]: update for update in updates}
+
+        nearby_by_cell: Dict[Tuple[int, int], Set[str]] = {}
+        deliveries = []
+        for client in self.connected_clients:
+            player = players.get(self.websocket_to_player.get(client))
+            if player is None:
+                continue
+            cell = self._interest_cell(player.x, player.y)
+            if cell not in nearby_by_cell:
+                nearby_by_cell[cell] = self._nearby_players(by_cell, cell)
+            # The client already has its own state; don't echo it back
+            in_range = nearby_by_cell[cell] - {player.id}
+
+            visible = self._visible_players.get(client, set())
+            entered = in_range - visible
+            left = visible - in_range
+            self._visible_players[client] = in_range
+
+            # Entering players go out in full, so only the others need updates
+            moved = [pending[pid] for pid in in_range - entered if pid in pending]
+            if moved or entered or left:
+                deliveries.append(
+                    (client, self._encode_player_updates(moved, entered, left))
+                )
+
+        self._deliver(deliveries)
+
+    @staticmethod
+    def _nearby_players(
+        by_cell: Dict[Tuple[int, int], List[str]], cell: Tuple[int, int]
+    ) -> Set[str]:
+        """Collect the players in the 3x3 block of cells around one cell."""
+        cx, cy = cell
+        return {
+            player_id
+            for dx in (-1, 0, 1)
+            for dy in (-1, 0, 1)
+            for player_id in by_cell.get((cx + dx, cy + dy), ())
+        }
+
+    def _encode_player_updates(
+        self, updates: List[dict], entered: Set[str], left: Set[str]
+    ) -> bytes:
+        """Encode one client's batch of player updates and range changes."""
+        # Only the listed players' splits/ejected; clients patch those
+        # players and keep everyone else's
+        player_ids = [update["playerId"] for update in updates] + list(entered)
+        message = {
+            "type": "batch_player_updates",
+            "updates": updates,
+            "splits": self.game_service.get_player_splits(player_ids),
+            "ejected": self.game_service.get_player_ejected(player_ids),
+        }
+        if entered:
+            players = self.game_service.players
+            message["entered"] = [players[pid].to_dict() for pid in entered]
+        if left:
+            message["left"] = list(left)
+        return orjson.dumps(message)
+
+    @staticmethod
+    def _interest_cell(x: float, y: float) -> Tuple[int, int]:
+        """Get the interest grid cell containing a position."""
+        return int(x // INTEREST_RADIUS), int(y // INTEREST_RADIUS)
+
     async def handle_connection(self, websocket: WebSocket):
         """Handle a new WebSocket connection."""
         print(f"WebSocket connection attempt from {websocket.client}")
         await websocket.accept()
         print(f"WebSocket connection accepted for {websocket.client}")
 
-        self.connected_clients.add(websocket)
-
         # Create player for this connection
         player = self.game_service.create_player()
         self.websocket_to_player[websocket] = player.id
+        self._open_outbox(websocket)
 
         try:
-            # Send initial game state
-            await self._send_initial_state(websocket, player.id)
+            # Queue initial game state ahead of any broadcast
+            self._send_initial_state(websocket, player.id)
+            self.connected_clients.add(websocket)
+            # Init carries every player; the next batch hides those out of range
+            self._visible_players[websocket] = set(self.game_service.players) - {player.id}
 
             # Notify other players about new player
             await self._broadcast_player_joined(player, exclude=websocket)
@@ -67,56 +232,53 @@ class WebSocketService:
             print(f"WebSocket error for player {player.id}: {e}")
             await self._handle_disconnect(websocket, player.id)
 
-    async def _send_initial_state(self, websocket: WebSocket, player_id: str):
-        """Send initial game state to a newly connected player."""
+    def _send_initial_state(self, websocket: WebSocket, player_id: str):
+        """Queue the initial game state for a newly connected player."""
         initial_data = {
             "type": "init",
             "playerId": player_id,
-            "config": get_game_config(),
-            "pellets": self.game_service.get_all_pellets(),
-            "viruses": self.game_service.get_all_viruses(),
             "virusProjectiles": self.game_service.get_all_virus_projectiles(),
-            "players": [
-                p for p in self.game_service.get_all_players() if p["id"] != player_id
-            ],
+            # Includes the new player; the client filters itself out
+            "players": self.game_service.get_all_players(),
             "playerSplits": self.game_service.get_all_player_splits(),
             "playerEjected": self.game_service.get_all_player_ejected(),
         }
-        await websocket.send_json(initial_data)
+        # Config and world snapshots are pre-encoded; splice their bytes in
+        payload = encode_with_raw_fields(
+            initial_data,
+            config=GAME_CONFIG_BYTES,
+            pellets=self.game_service.get_pellets_json(),
+            viruses=self.game_service.get_viruses_json(),
+        )
+        self._outboxes[websocket].put_nowait(payload)
         print(f"Sent initial data to player {player_id}")
 
     async def _broadcast_player_joined(self, player, exclude: WebSocket = None):
         """Broadcast that a new player joined."""
-        message = {"type": "player_joined", "player": asdict(player)}
+        message = {"type": "player_joined", "player": player.to_dict()}
+        for client, visible in self._visible_players.items():
+            if client is not exclude:
+                visible.add(player.id)
         await self._broadcast_message(message, exclude=exclude)
 
     async def _handle_client_messages(self, websocket: WebSocket, player_id: str):
         """Handle incoming messages from a client."""
         while True:
-            data = await websocket.receive_json()
+            # orjson parses in C; receive_json would go through stdlib json
+            data = orjson.loads(await websocket.receive_text())
             await self._process_message(websocket, player_id, data)
 
     async def _process_message(self, websocket: WebSocket, player_id: str, data: dict):
         """Process a single message from a client."""
-        message_type = data.get("type")
-
-        if message_type == "player_update":
-            await self._handle_player_update(websocket, player_id, data)
-        elif message_type == "consume_pellet":
-            await self._handle_consume_pellet(data)
-        elif message_type == "feed_virus":
-            await self._handle_feed_virus(data)
-        elif message_type == "consume_virus":
-            await self._handle_consume_virus(data)
-        elif message_type == "consume_player":
-            await self._handle_consume_player(player_id, data)
-        elif message_type == "consume_other_ejected":
-            await self._handle_consume_other_ejected(player_id, data)
-
-    async def _handle_player_update(
-        self, websocket: WebSocket, player_id: str, data: dict
-    ):
+        handler = self._message_handlers.get(data.get("type"))
+        if handler:
+            await handler(player_id, data)
+
+    async def _handle_player_update(self, player_id: str, data: dict):
         """Handle player position/state update."""
+        player = self.game_service.players.get(player_id)
+        previous_color = player.color if player else None
+
         # Update player state
         self.game_service.update_player(
             player_id,
@@ -134,23 +296,25 @@ class WebSocketService:
         if "ejected" in data:
             self.game_service.update_player_ejected(player_id, data["ejected"])
 
-        # Broadcast to other players
-        player = self.game_service.players.get(player_id)
+        # Queue for the next batch; a newer update supersedes a pending one
         if player:
-            update_message = {
-                "type": "player_update",
+            update = {
                 "playerId": player_id,
                 "x": data["x"],
                 "y": data["y"],
                 "mass": data["mass"],
                 "radius": data["radius"],
-                "color": player.color,
-                "splits": self.game_service.get_all_player_splits(),
-                "ejected": self.game_service.get_all_player_ejected(),
             }
-            await self._broadcast_message(update_message, exclude=websocket)
-
-    async def _handle_consume_pellet(self, data: dict):
+            # Joins and range entries carry the full player, so only send
+            # the color when it changes
+            pending = self._pending_player_updates.get(player_id)
+            if player.color != previous_color:
+                update["color"] = player.color
+            elif pending and "color" in pending:
+                update["color"] = pending["color"]
+            self._pending_player_updates[player_id] = update
+
+    async def _handle_consume_pellet(self, player_id: str, data: dict):
         """Handle pellet consumption."""
         pellet_id = data["pelletId"]
         result = self.game_service.consume_pellet(pellet_id)
@@ -159,7 +323,7 @@ class WebSocketService:
             message = {"type": "pellet_update", **result}
             await self._broadcast_message(message)
 
-    async def _handle_feed_virus(self, data: dict):
+    async def _handle_feed_virus(self, player_id: str, data: dict):
         """Handle virus feeding."""
         virus_id = data["virusId"]
         feed_angle = data["angle"]
@@ -169,7 +333,7 @@ class WebSocketService:
             message = {"type": "virus_feed", **result}
             await self._broadcast_message(message)
 
-    async def _handle_consume_virus(self, data: dict):
+    async def _handle_consume_virus(self, player_id: str, data: dict):
         """Handle virus consumption."""
         virus_id = data["virusId"]
         result = self.game_service.consume_virus(virus_id)
@@ -193,6 +357,8 @@ class WebSocketService:
 
         if result:
             print(f"Consumption successful: {result}")
+            if result["targetType"] == "player":
+                self._pending_player_updates.pop(result["targetId"], None)
             message = {"type": "player_consumed", **result}
             await self._broadcast_message(message)
         else:
@@ -217,11 +383,15 @@ class WebSocketService:
         print(f"Player {player_id} disconnected")
         
         # Clean up
-        if websocket in self.connected_clients:
-            self.connected_clients.remove(websocket)
-        if websocket in self.websocket_to_player:
-            del self.websocket_to_player[websocket]
-
+        self.connected_clients.discard(websocket)
+        self.websocket_to_player.pop(websocket, None)
+        self._close_outbox(websocket)
+        self._visible_players.pop(websocket, None)
+        # Everyone drops the player on player_left, in range or not
+        for visible in self._visible_players.values():
+            visible.discard(player_id)
+
+        self._pending_player_updates.pop(player_id, None)
         self.game_service.remove_player(player_id)
 
         # Notify other players
@@ -230,21 +400,94 @@ class WebSocketService:
 
     async def _broadcast_message(self, message: dict, exclude: WebSocket = None):
         """Broadcast a message to all connected clients."""
-        disconnected = set()
+        # Serialize once and fan out the same frame to every client
+        await self._broadcast(orjson.dumps(message), exclude=exclude)
 
-        for client in self.connected_clients:
-            if client == exclude:
-                continue
+    async def _broadcast(self, payload: bytes, exclude: WebSocket = None):
+        """Queue a pre-encoded payload for all connected clients."""
+        self._deliver(
+            [(client, payload) for client in self.connected_clients if client is not exclude]
+        )
 
+    def _deliver(self, deliveries: List[Tuple[WebSocket, bytes]]):
+        """Queue each payload for its client, dropping clients that overflow."""
+        overflowed = []
+        for client, payload in deliveries:
             try:
-                await client.send_json(message)
-            except:
-                disconnected.add(client)
-
-        # Clean up disconnected clients
-        self.connected_clients -= disconnected
-        for client in disconnected:
-            if client in self.websocket_to_player:
-                player_id = self.websocket_to_player[client]
-                del self.websocket_to_player[client]
-                self.game_service.remove_player(player_id)
\ No newline at end of file
+                self._outboxes[client].put_nowait(payload)
+            except asyncio.QueueFull:
+                overflowed.append(client)
+
+        # A client this far behind can't catch up; dropping individual
+        # messages instead would silently desync its world state
+        for client in overflowed:
+            self._drop_client(client)
+
+    def _open_outbox(self, websocket: WebSocket):
+        """Create the outbound queue and writer task for a client."""
+        queue = asyncio.Queue(maxsize=CLIENT_OUTBOX_SIZE)
+        self._outboxes[websocket] = queue
+        self._writer_tasks[websocket] = asyncio.create_task(
+            self._write_loop(websocket, queue)
+        )
+
+    def _close_outbox(self, websocket: WebSocket):
+        """Stop a client's writer task and discard its pending messages."""
+        self._outboxes.pop(websocket, None)
+        task = self._writer_tasks.pop(websocket, None)
+        # A writer dropping its own client must not cancel itself mid-close
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+    async def _write_loop(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Drain a client's outbound queue onto its socket."""
+        try:
+            while True:
+                # Take whatever backlog built up while the last send was in
+                # flight, so a burst of events goes out as one frame
+                backlog = [await queue.get()]
+                while not queue.empty():
+                    backlog.append(queue.get_nowait())
+
+                # Check the state rather than let send raise on a closed socket
+                if websocket.application_state != WebSocketState.CONNECTED:
+                    break
+                for frame in coalesce_json_frames(backlog):
+                    await asyncio.wait_for(
+                        websocket.send_bytes(frame), timeout=CLIENT_SEND_TIMEOUT
+                    )
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            # The client stopped reading; treat it like an overflowed outbox
+            self._drop_client(websocket)
+            return
+        except Exception as e:
+            print(f"WebSocket send failed for {websocket.client}: {e}")
+
+        # Stop queueing for a dead socket; the receive loop sees the
+        # disconnect and finishes the cleanup
+        self.connected_clients.discard(websocket)
+        self._outboxes.pop(websocket, None)
+
+    def _drop_client(self, websocket: WebSocket):
+        """Disconnect a client whose outbound queue overflowed."""
+        print(f"Dropping slow client {websocket.client}")
+        self.connected_clients.discard(websocket)
+        self._close_outbox(websocket)
+        if websocket.application_state != WebSocketState.CONNECTED:
+            return
+        # The close handshake can take seconds against a stalled peer, so it
+        # must not hold up the tick or another client's handler
+        task = asyncio.create_task(self._close_client(websocket))
+        self._close_tasks.add(task)
+        task.add_done_callback(self._close_tasks.discard)
+
+    async def _close_client(self, websocket: WebSocket):
+        """Close a dropped client's socket."""
+        try:
+            # The receive loop then raises WebSocketDisconnect and cleans up
+            await websocket.close(code=1013)
+        except Exception as e:
+            # Detached, so an escaping error would go unretrieved; log it here
+            print(f"WebSocket close failed for {websocket.client}: {e}")
@@ -0,0 +1,50 @@
+import unittest
+
+from services.game_service import GameService
+
+
+def split(split_id, x=0):
+    return {"id": split_id, "x": x, "y": 0, "mass": 10}
+
+
+class UpdatePlayerSplitsTest(unittest.TestCase):
+    """Split updates keyed by client-provided IDs."""
+
+    def setUp(self):
+        self.game = GameService()
+
+    def test_empty_update_removes_all_splits(self):
+        self.game.update_player_splits("a", [split("x"), split("y")])
+        self.game.update_player_splits("a", [])
+
+        self.assertEqual(self.game.player_splits, {})
+        self.assertEqual(self.game.get_player_splits(["a"]), [])
+
+    def test_colliding_id_is_kept_for_new_owner(self):
+        self.game.update_player_splits("a", [split("x"), split("y")])
+        self.game.update_player_splits("b", [split("x", x=5)])
+        self.game.update_player_splits("a", [split("y")])
+
+        self.assertEqual(self.game.player_splits["x"].playerId, "b")
+        self.assertEqual(self.game.player_splits["x"].x, 5)
+        self.assertEqual([s["id"] for s in self.game.get_player_splits(["b"])], ["x"])
+        self.assertEqual([s["id"] for s in self.game.get_player_splits(["a"])], ["y"])
+
+    def test_clearing_player_keeps_taken_over_split(self):
+        self.game.update_player_splits("a", [split("x")])
+        self.game.update_player_splits("b", [split("x")])
+        self.game.remove_player("a")
+
+        self.assertEqual(self.game.player_splits["x"].playerId, "b")
+
+    def test_fallback_ids_are_stable_across_updates(self):
+        id_less = [{"x": 0, "y": 0, "mass": 10}, {"x": 5, "y": 0, "mass": 10}]
+        for _ in range(4):
+            self.game.update_player_splits("a", id_less)
+
+        self.assertEqual(sorted(self.game.player_splits), ["split-a-0", "split-a-1"])
+        self.assertEqual(self.game.player_splits["split-a-1"].x, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import struct
+import unittest
+
+import orjson
+
+from models.entities import VirusProjectile
+from utils.helpers import (
+    OPCODE_PROJECTILE_UPDATE,
+    coalesce_json_frames,
+    encode_with_raw_fields,
+    pack_projectile_updates,
+)
+
+
+class CoalesceJsonFramesTest(unittest.TestCase):
+    """Outbound backlogs merged into as few frames as possible."""
+
+    def test_run_of_objects_becomes_one_array(self):
+        payloads = [orjson.dumps({"n": i}) for i in range(3)]
+
+        [frame] = coalesce_json_frames(payloads)
+
+        self.assertEqual(orjson.loads(frame), [{"n": 0}, {"n": 1}, {"n": 2}])
+
+    def test_single_object_passes_through(self):
+        payload = orjson.dumps({"n": 0})
+
+        self.assertEqual(coalesce_json_frames([payload]), [payload])
+
+    def test_binary_frames_split_runs_in_order(self):
+        binary = b"\x01\x00\x00"
+        payloads = [
+            orjson.dumps({"n": 0}),
+            orjson.dumps({"n": 1}),
+            binary,
+            orjson.dumps({"n": 2}),
+        ]
+
+        frames = coalesce_json_frames(payloads)
+
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(orjson.loads(frames[0]), [{"n": 0}, {"n": 1}])
+        self.assertIs(frames[1], binary)
+        self.assertEqual(orjson.loads(frames[2]), {"n": 2})
+
+    def test_empty_backlog(self):
+        self.assertEqual(coalesce_json_frames([]), [])
+
+
+class EncodeWithRawFieldsTest(unittest.TestCase):
+    """Messages with pre-encoded fields spliced in."""
+
+    def test_raw_fields_are_spliced_in(self):
+        encoded = encode_with_raw_fields(
+            {"type": "init", "playerId": "p"},
+            config=orjson.dumps({"worldSize": 10}),
+            pellets=orjson.dumps([{"id": 1}]),
+        )
+
+        self.assertEqual(
+            orjson.loads(encoded),
+            {
+                "type": "init",
+                "playerId": "p",
+                "config": {"worldSize": 10},
+                "pellets": [{"id": 1}],
+            },
+        )
+
+    def test_splices_into_empty_message(self):
+        encoded = encode_with_raw_fields({}, pellets=b"[]")
+
+        self.assertEqual(orjson.loads(encoded), {"pellets": []})
+
+    def test_without_raw_fields(self):
+        self.assertEqual(encode_with_raw_fields({"a": 1}), b'{"a":1}')
+
+
+class PackProjectileUpdatesTest(unittest.TestCase):
+    """Binary projectile frame layout read by the client."""
+
+    def test_header_and_entries(self):
+        projectiles = [
+            VirusProjectile(id=7, x=1.5, y=2.5, vx=3.0, vy=-4.0, travelled=5.0, mass=100),
+            VirusProjectile(id=8, x=6.0, y=7.0, vx=0.0, vy=0.0, travelled=0.0, mass=100),
+        ]
+
+        frame = pack_projectile_updates(projectiles)
+
+        self.assertEqual(len(frame), 3 + 28 * 2)
+        self.assertEqual(struct.unpack_from("<BH", frame), (OPCODE_PROJECTILE_UPDATE, 2))
+        self.assertEqual(
+            struct.unpack_from("<I6f", frame, 3), (7, 1.5, 2.5, 3.0, -4.0, 5.0, 100.0)
+        )
+        self.assertEqual(
+            struct.unpack_from("<I6f", frame, 3 + 28), (8, 6.0, 7.0, 0.0, 0.0, 0.0, 100.0)
+        )
+
+    def test_empty_frame(self):
+        self.assertEqual(pack_projectile_updates([]), struct.pack("<BH", OPCODE_PROJECTILE_UPDATE, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import asyncio
+import unittest
+
+import orjson
+
+from services.game_service import GameService
+from services.websocket_service import WebSocketService
+
+
+class FakeWebSocket:
+    """Stand-in socket; tests read what was queued for it."""
+
+
+class PlayerUpdateBroadcastTest(unittest.IsolatedAsyncioTestCase):
+    """Batched player updates fanned out to nearby clients."""
+
+    def setUp(self):
+        self.service = WebSocketService(GameService())
+
+    def connect(self, x: float, y: float):
+        player = self.service.game_service.create_player()
+        player.x, player.y = x, y
+        websocket = FakeWebSocket()
+        self.service.websocket_to_player[websocket] = player.id
+        self.service._outboxes[websocket] = asyncio.Queue()
+        self.service.connected_clients.add(websocket)
+        # Mirror handle_connection: init and player_joined show everyone
+        for visible in self.service._visible_players.values():
+            visible.add(player.id)
+        players = self.service.game_service.players
+        self.service._visible_players[websocket] = set(players) - {player.id}
+        return websocket, player.id
+
+    async def move(self, player_id: str, x: float, y: float, **extra):
+        data = {"x": x, "y": y, "mass": 25, "radius": 25, **extra}
+        await self.service._handle_player_update(player_id, data)
+
+    async def flush(self):
+        updates = list(self.service._pending_player_updates.values())
+        self.service._pending_player_updates.clear()
+        await self.service._broadcast_player_updates(updates)
+
+    def received(self, websocket) -> list:
+        queue = self.service._outboxes[websocket]
+        messages = []
+        while not queue.empty():
+            messages.append(orjson.loads(queue.get_nowait()))
+        return messages
+
+    async def test_own_update_is_not_echoed(self):
+        a, a_id = self.connect(100, 100)
+        b, b_id = self.connect(200, 200)
+        await self.move(a_id, 110, 110)
+        await self.move(b_id, 210, 210)
+        await self.flush()
+
+        [message] = self.received(a)
+        self.assertEqual([u["playerId"] for u in message["updates"]], [b_id])
+        [message] = self.received(b)
+        self.assertEqual([u["playerId"] for u in message["updates"]], [a_id])
+
+    async def test_lone_update_sends_nothing_to_its_owner(self):
+        a, a_id = self.connect(100, 100)
+        await self.move(a_id, 110, 110)
+        await self.flush()
+
+        self.assertEqual(self.received(a), [])
+
+    async def test_color_changed_out_of_range_is_sent_on_entry(self):
+        a, a_id = self.connect(100, 100)
+        b, b_id = self.connect(20000, 20000)
+        await self.move(b_id, 20010, 20010, color="hsl(42, 70%, 50%)")
+        await self.flush()
+        [message] = self.received(a)
+        self.assertEqual(message["left"], [b_id])
+
+        await self.move(b_id, 150, 150)
+        await self.flush()
+
+        [message] = self.received(a)
+        self.assertEqual(message["updates"], [])
+        [entered] = message["entered"]
+        self.assertEqual(entered["id"], b_id)
+        self.assertEqual(entered["color"], "hsl(42, 70%, 50%)")
+        self.assertEqual((entered["x"], entered["y"]), (150, 150))
+
+    async def test_player_leaving_range_is_hidden_once(self):
+        a, a_id = self.connect(100, 100)
+        b, b_id = self.connect(200, 200)
+        await self.move(b_id, 210, 210, splits=[{"id": "s", "x": 220, "y": 220, "mass": 10}])
+        await self.flush()
+        [message] = self.received(a)
+        self.assertEqual([u["playerId"] for u in message["updates"]], [b_id])
+        self.assertEqual([s["id"] for s in message["splits"]], ["s"])
+
+        await self.move(b_id, 20000, 20000)
+        await self.flush()
+        [message] = self.received(a)
+        self.assertEqual(message["updates"], [])
+        self.assertEqual(message["left"], [b_id])
+
+        await self.move(b_id, 20010, 20010)
+        await self.flush()
+        self.assertEqual(self.received(a), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
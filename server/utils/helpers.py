@@ -2,14 +2,35 @@
 """Utility functions and helpers."""
 
 import math
+import struct
+
+import orjson
 from config.settings import PELLET_RADIUS
 
+# Entity colors, built once instead of per spawn. A power-of-two size lets
+# spawns pick one with getrandbits(HSL_PALETTE_BITS) while keeping hues uniform.
+HSL_PALETTE_BITS = 9
+HSL_PALETTE = [
+    f"hsl({i * 360 / (1 << HSL_PALETTE_BITS):g},70%,60%)"
+    for i in range(1 << HSL_PALETTE_BITS)
+]
+
+# Binary projectile frame: opcode + count, then id, x, y, vx, vy, travelled, mass
+OPCODE_PROJECTILE_UPDATE = 0x01
+_PROJECTILE_HEADER = struct.Struct("<BH")
+_PROJECTILE_ENTRY = struct.Struct("<I6f")
+
 
 def calculate_radius(mass: float) -> float:
     """Calculate radius from mass using the same formula as client."""
     return PELLET_RADIUS * math.sqrt(mass)
 
 
+def calculate_radius_squared(mass: float) -> float:
+    """Calculate the squared radius from mass, for sqrt-free distance checks."""
+    return PELLET_RADIUS * PELLET_RADIUS * mass
+
+
 def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
     """Calculate distance between two points."""
     return math.hypot(x2 - x1, y2 - y1)
@@ -25,11 +46,7 @@ def clamp_to_world(x: float, y: float, radius: float, world_size: float) -> tupl
 
 def normalize_angle(angle: float) -> float:
     """Normalize angle to [-π, π] range."""
-    while angle > math.pi:
-        angle -= 2 * math.pi
-    while angle < -math.pi:
-        angle += 2 * math.pi
-    return angle
+    return math.remainder(angle, math.tau)
 
 
 def lerp(a: float, b: float, t: float) -> float:
@@ -41,4 +58,73 @@ def is_collision(
     x1: float, y1: float, r1: float, x2: float, y2: float, r2: float
 ) -> bool:
     """Check if two circles are colliding."""
-    return calculate_distance(x1, y1, x2, y2) < (r1 + r2)
+    dx = x2 - x1
+    dy = y2 - y1
+    reach = r1 + r2
+    return dx * dx + dy * dy < reach * reach
+
+
+def pack_projectile_updates(projectiles: list) -> bytes:
+    """Pack projectile positions into a binary frame for the client."""
+    frame = bytearray(
+        _PROJECTILE_HEADER.size + _PROJECTILE_ENTRY.size * len(projectiles)
+    )
+    _PROJECTILE_HEADER.pack_into(frame, 0, OPCODE_PROJECTILE_UPDATE, len(projectiles))
+    offset = _PROJECTILE_HEADER.size
+    for proj in projectiles:
+        _PROJECTILE_ENTRY.pack_into(
+            frame,
+            offset,
+            proj.id,
+            proj.x,
+            proj.y,
+            proj.vx,
+            proj.vy,
+            proj.travelled,
+            proj.mass,
+        )
+        offset += _PROJECTILE_ENTRY.size
+    return bytes(frame)
+
+
+def encode_with_raw_fields(message: dict, **raw_fields: bytes) -> bytes:
+    """Encode a message, splicing in fields that are already JSON-encoded.
+
+    Lets large cached snapshots be embedded in a message without decoding
+    and re-encoding them.
+    """
+    encoded = orjson.dumps(message)
+    if not raw_fields:
+        return encoded
+    fields = b",".join(
+        orjson.dumps(key) + b":" + value for key, value in raw_fields.items()
+    )
+    separator = b"," if message else b""
+    return encoded[:-1] + separator + fields + b"}"
+
+
+def coalesce_json_frames(payloads: list) -> list:
+    """Merge runs of consecutive JSON objects into JSON array frames.
+
+    Binary frames are passed through in place, so message order is kept.
+    """
+    frames = []
+    run = []
+    for payload in payloads:
+        if payload[:1] == b"{":
+            run.append(payload)
+            continue
+        if run:
+            frames.append(_join_json_run(run))
+            run = []
+        frames.append(payload)
+    if run:
+        frames.append(_join_json_run(run))
+    return frames
+
+
+def _join_json_run(run: list) -> bytes:
+    """Join encoded JSON objects into one array, or pass a single one through."""
+    if len(run) == 1:
+        return run[0]
+    return b"[" + b",".join(run) + b"]"